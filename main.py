@@ -9,20 +9,172 @@ import base64
 import sqlite3
 import aiohttp
 import time
+import gzip
+import random
+import queue
+import atexit
+import shutil
+import signal
+import threading
 from datetime import datetime, timedelta
 from io import BytesIO
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 from dotenv import load_dotenv
 from discord.ext import commands, tasks
 from typing import Optional, List, Dict, Any
 
 # --- 0. Loglama Yapılandırması ---
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("melianime_bot.log"),
-        logging.StreamHandler()
-    ])
+# Loglama ayarları .env üzerinden de okunabilsin diye dotenv en başta yüklenir
+load_dotenv()
+
+LOG_FILE = os.getenv("LOG_FILE", "melianime_bot.log")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()  # text / json
+LOG_ROTATION = os.getenv("LOG_ROTATION", "size").lower()  # size / time
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+LOG_RATE_LIMIT_WINDOW = float(os.getenv("LOG_RATE_LIMIT_WINDOW", "60"))
+LOG_RATE_LIMIT_BURST = int(os.getenv("LOG_RATE_LIMIT_BURST", "10"))
+LOG_TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Log kayıtlarını tek satırlık JSON olarak biçimlendir"""
+
+    def format(self, record):
+        payload = {
+            'timestamp': datetime.utcfromtimestamp(record.created).isoformat() + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'line': record.lineno,
+        }
+        if record.exc_info:
+            payload['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """Tekrarlayan mesajları pencere başına belirli bir sayıyla sınırla
+
+    Birebir aynı mesaj (aynı şablon ve argümanlar) için her pencerede en fazla
+    `burst` kayıt geçer, fazlası sayılarak bastırılır. Aynı şablonu kullanan
+    farklı olaylar birbirini bastırmaz. WARNING ve üzeri seviyeler ile
+    `extra={'sample': False}` verilen kayıtlar asla bastırılmaz.
+    """
+
+    MAX_BUCKETS = 1000
+
+    def __init__(self, window: float, burst: int):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        # Kovalar pencere başlangıcına göre sıralıdır; en eskisi her zaman baştadır
+        self._buckets: OrderedDict = OrderedDict()
+        self._last_prune = 0.0
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or self.burst <= 0 or not getattr(record, 'sample', True):
+            return True
+
+        # Anahtar şablon + argümanlardan kurulur; `%` birleştirmesi listener
+        # iş parçacığına kalır. Hashlenemeyen argümanlarda biçimlendirilmiş metin kullanılır.
+        key = (record.name, record.levelno, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            key = (record.name, record.levelno, record.getMessage())
+        now = record.created
+        if now - self._last_prune >= self.window:
+            self._prune(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None or now - bucket[0] >= self.window:
+            suppressed = bucket[2] if bucket else 0
+            if bucket is None and len(self._buckets) >= self.MAX_BUCKETS:
+                self._buckets.popitem(last=False)
+            self._buckets[key] = [now, 1, 0]
+            self._buckets.move_to_end(key)
+            if suppressed:
+                record.msg = f"{record.msg} ({suppressed} benzer mesaj bastırıldı)"
+            return True
+
+        if bucket[1] < self.burst:
+            bucket[1] += 1
+            return True
+
+        bucket[2] += 1
+        return False
+
+    def _prune(self, now: float):
+        """Süresi dolmuş kovaları baştan at (pencere başına en fazla bir kez)
+
+        Bir kova, bastırılan sayısını bir sonraki pencerede raporlayabilsin diye
+        iki pencere boyunca tutulur.
+        """
+        self._last_prune = now
+        while self._buckets:
+            oldest = next(iter(self._buckets.values()))
+            if now - oldest[0] < 2 * self.window:
+                break
+            self._buckets.popitem(last=False)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Biçimlendirmeyi arka plan iş parçacığına bırakan QueueHandler
+
+    Standart QueueHandler mesajı çağıran iş parçacığında biçimlendirir;
+    burada kayıt olduğu gibi kuyruğa atılır ve `%` birleştirmesi ile disk
+    yazımı QueueListener iş parçacığında yapılır. (RateLimitFilter yalnızca
+    argümanları hashlenemeyen kayıtlarda çağıran tarafta biçimlendirir.)
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def _gzip_rotator(source, dest):
+    """Döndürülen log dosyasını gzip ile sıkıştır"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def setup_logging():
+    """Kuyruk tabanlı, döndürmeli ve sıkıştırmalı loglamayı kur"""
+    if LOG_ROTATION == 'time':
+        file_handler = TimedRotatingFileHandler(
+            LOG_FILE, when='midnight', backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+    else:
+        file_handler = RotatingFileHandler(
+            LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding='utf-8')
+    file_handler.namer = lambda name: name + '.gz'
+    file_handler.rotator = _gzip_rotator
+
+    stream_handler = logging.StreamHandler()
+
+    formatter = JsonLogFormatter() if LOG_FORMAT == 'json' else logging.Formatter(LOG_TEXT_FORMAT)
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter(LOG_RATE_LIMIT_WINDOW, LOG_RATE_LIMIT_BURST))
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
+    root.handlers.clear()
+    root.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+log_listener = setup_logging()
 logger = logging.getLogger('MelianimeBot')
 
 # --- 1. Bot İstemcisi ve Gerekli İzinler ---
@@ -33,7 +185,43 @@ intents.guilds = True
 intents.reactions = True
 intents.members = True
 
-bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
+class MelianimeBot(commands.Bot):
+    """Başlangıç işlerini on_ready'den ayıran ve kapanışta durumu kaydeden bot istemcisi"""
+    
+    async def setup_hook(self):
+        # Gateway yeniden bağlantılarında tekrar tetiklenen on_ready yerine
+        # yalnızca bir kez çalışır; periyodik görevler burada başlatılır
+        anime_checker.start()
+        history_maintenance.start()
+        if PURGE_RETENTION_DAYS:
+            purge_retention.start()
+        
+        # systemd / docker stop SIGTERM gönderir; anlık görüntünün yazılması için
+        # Ctrl-C gibi temiz kapanış yolundan geçilir
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, self._handle_sigterm)
+        except (NotImplementedError, RuntimeError):
+            # Windows olay döngüsü sinyal işleyicilerini desteklemez
+            pass
+    
+    def _handle_sigterm(self):
+        logger.info("SIGTERM alındı, bot kapatılıyor")
+        self._shutdown_task = asyncio.create_task(self.close())
+    
+    async def close(self):
+        try:
+            if not self.is_closed():
+                write_snapshot()
+        except Exception as e:
+            # Anlık görüntü yazılamasa da kapanış tamamlanmalı
+            logger.error("Anlık görüntü kaydedilemedi: %s", e)
+        finally:
+            try:
+                await close_movifox_session()
+            finally:
+                await super().close()
+
+bot = MelianimeBot(command_prefix='!', intents=intents, help_command=None)
 
 # --- 2. Çevre Değişkenleri ve Sabitler ---
 PREFIX = "!"
@@ -49,15 +237,32 @@ PURGE_CHANNEL_ID = None
 AUTHORIZED_USER_IDS = []
 ANILIST_API_URL = "https://graphql.anilist.co"
 MOVIFOX_API_URL = None
+MOVIFOX_API_KEY = None
+PURGE_RETENTION_DAYS = None
+HISTORY_RETENTION_DAYS = None
 
 # --- 3. Veritabanı Fonksiyonları ---
 DATABASE_NAME = 'melianime_bot.db'
+HISTORY_ARCHIVE_DIR = os.getenv("HISTORY_ARCHIVE_DIR", "history_archive")
+HISTORY_ARCHIVE_BATCH = 1000
+HISTORY_ARCHIVE_INDEX = "index.json"
+# Arşiv dosyalarına ekleme (history_maintenance) ile okuma (!bölüm-geçmişi) farklı
+# iş parçacıklarında çalışır; yarım yazılmış gzip üyesi okunmasın diye ortak kilit
+history_archive_lock = threading.RLock()
+ARCHIVE_READ_ERRORS = (EOFError, gzip.BadGzipFile, OSError, ValueError)
 
 def init_db():
     """Veritabanını başlat ve tabloları oluştur"""
     conn = sqlite3.connect(DATABASE_NAME)
     c = conn.cursor()
     
+    # Silinen sayfaların sonradan geri verilebilmesi için artımlı vacuum modu.
+    # Mevcut bir veritabanında mod ancak tam bir VACUUM ile değişir (tek seferlik).
+    c.execute("PRAGMA auto_vacuum")
+    if c.fetchone()[0] != 2:
+        c.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        c.execute("VACUUM")
+    
     # Ana konfigürasyon tablosu
     c.execute('''
         CREATE TABLE IF NOT EXISTS config (
@@ -105,10 +310,33 @@ def init_db():
         )
     ''')
     
+    # Sayfalama (keyset) sorguları için indeksler
+    c.execute('''
+        CREATE INDEX IF NOT EXISTS idx_anime_tracking_status_updated
+        ON anime_tracking (status, updated_at, id)
+    ''')
+    c.execute('''
+        CREATE INDEX IF NOT EXISTS idx_episode_history_anime_episode
+        ON episode_history (anime_id, episode_number, id)
+    ''')
+    
     conn.commit()
     conn.close()
     logger.info("Veritabanı başlatıldı ve tablolar oluşturuldu")
 
+# Konfigürasyon tablosunun bellek içi kopyası; ilk okumada tek sorguyla yüklenir
+config_cache: Optional[Dict[str, str]] = None
+
+def load_config_cache() -> Dict[str, str]:
+    """Tüm konfigürasyonu tek sorguyla belleğe yükle"""
+    global config_cache
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    c.execute("SELECT key, value FROM config")
+    config_cache = dict(c.fetchall())
+    conn.close()
+    return config_cache
+
 def save_config(key: str, value: str):
     """Konfigürasyon kaydet"""
     conn = sqlite3.connect(DATABASE_NAME)
@@ -119,19 +347,17 @@ def save_config(key: str, value: str):
     """, (key, str(value)))
     conn.commit()
     conn.close()
-    logger.info(f"Konfigürasyon kaydedildi: {key} = {value}")
+    if config_cache is not None:
+        config_cache[key] = str(value)
+    logger.info("Konfigürasyon kaydedildi: %s = %s", key, value)
 
 def get_config(key: str) -> Optional[str]:
     """Konfigürasyon getir"""
-    conn = sqlite3.connect(DATABASE_NAME)
-    c = conn.cursor()
-    c.execute("SELECT value FROM config WHERE key = ?", (key,))
-    result = c.fetchone()
-    conn.close()
-    if result:
-        logger.debug(f"Konfigürasyon yüklendi: {key} = {result[0]}")
-        return result[0]
-    return None
+    cache = config_cache if config_cache is not None else load_config_cache()
+    value = cache.get(key)
+    if value is not None:
+        logger.debug("Konfigürasyon yüklendi: %s = %s", key, value)
+    return value
 
 def add_anime_tracking(anilist_id: int, title: str) -> bool:
     """Anime takip listesine ekle"""
@@ -143,16 +369,29 @@ def add_anime_tracking(anilist_id: int, title: str) -> bool:
             VALUES (?, ?, CURRENT_TIMESTAMP)
         """, (anilist_id, title))
         conn.commit()
-        logger.info(f"Anime takip listesine eklendi: {title} (ID: {anilist_id})")
+        invalidate_tracked_anime_cache()
+        logger.info("Anime takip listesine eklendi: %s (ID: %s)", title, anilist_id)
         return True
     except Exception as e:
-        logger.error(f"Anime takip listesine eklenirken hata: {e}")
+        logger.error("Anime takip listesine eklenirken hata: %s", e)
         return False
     finally:
         conn.close()
 
+# Aktif takip listesinin bellek içi kopyası; takip/bölüm yazımlarında geçersiz kılınır
+tracked_anime_cache: Optional[List[Dict[str, Any]]] = None
+
+def invalidate_tracked_anime_cache():
+    """Takip listesi önbelleğini geçersiz kıl"""
+    global tracked_anime_cache
+    tracked_anime_cache = None
+
 def get_tracked_anime() -> List[Dict[str, Any]]:
     """Takip edilen anime listesini getir"""
+    global tracked_anime_cache
+    if tracked_anime_cache is not None:
+        return tracked_anime_cache
+    
     conn = sqlite3.connect(DATABASE_NAME)
     c = conn.cursor()
     c.execute("""
@@ -164,7 +403,7 @@ def get_tracked_anime() -> List[Dict[str, Any]]:
     results = c.fetchall()
     conn.close()
     
-    return [
+    tracked_anime_cache = [
         {
             'anilist_id': row[0],
             'title': row[1],
@@ -174,6 +413,107 @@ def get_tracked_anime() -> List[Dict[str, Any]]:
         }
         for row in results
     ]
+    return tracked_anime_cache
+
+def count_tracked_anime() -> int:
+    """Aktif takip edilen anime sayısını getir"""
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM anime_tracking WHERE status = 'active'")
+    result = c.fetchone()
+    conn.close()
+    return result[0] if result else 0
+
+def get_tracked_anime_page(cursor: Optional[tuple] = None, limit: int = 10) -> List[Dict[str, Any]]:
+    """Takip listesinin bir sayfasını (updated_at, id) keyset sayfalamasıyla getir
+    
+    `cursor` önceki sayfanın son satırının (updated_at, id) değeridir.
+    """
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    if cursor:
+        c.execute("""
+            SELECT id, anilist_id, title, last_episode, status, updated_at 
+            FROM anime_tracking 
+            WHERE status = 'active' AND (updated_at, id) < (?, ?) 
+            ORDER BY updated_at DESC, id DESC 
+            LIMIT ?
+        """, (cursor[0], cursor[1], limit))
+    else:
+        c.execute("""
+            SELECT id, anilist_id, title, last_episode, status, updated_at 
+            FROM anime_tracking 
+            WHERE status = 'active' 
+            ORDER BY updated_at DESC, id DESC 
+            LIMIT ?
+        """, (limit,))
+    results = c.fetchall()
+    conn.close()
+    
+    return [
+        {
+            'id': row[0],
+            'anilist_id': row[1],
+            'title': row[2],
+            'last_episode': row[3],
+            'status': row[4],
+            'updated_at': row[5]
+        }
+        for row in results
+    ]
+
+def count_episode_history(anime_id: int) -> int:
+    """Bir animenin bölüm geçmişindeki kayıt sayısını getir"""
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM episode_history WHERE anime_id = ?", (anime_id,))
+    result = c.fetchone()
+    conn.close()
+    return result[0] if result else 0
+
+def get_episode_history_page(anime_id: int, cursor: Optional[tuple] = None, limit: int = 10) -> List[Dict[str, Any]]:
+    """Bölüm geçmişinin bir sayfasını (episode_number, id) keyset sayfalamasıyla getir"""
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    if cursor:
+        c.execute("""
+            SELECT id, episode_number, episode_title, wordpress_post_id, discord_message_id, created_at 
+            FROM episode_history 
+            WHERE anime_id = ? AND (episode_number, id) > (?, ?) 
+            ORDER BY episode_number, id 
+            LIMIT ?
+        """, (anime_id, cursor[0], cursor[1], limit))
+    else:
+        c.execute("""
+            SELECT id, episode_number, episode_title, wordpress_post_id, discord_message_id, created_at 
+            FROM episode_history 
+            WHERE anime_id = ? 
+            ORDER BY episode_number, id 
+            LIMIT ?
+        """, (anime_id, limit))
+    results = c.fetchall()
+    conn.close()
+    
+    return [
+        {
+            'id': row[0],
+            'episode_number': row[1],
+            'episode_title': row[2],
+            'wordpress_post_id': row[3],
+            'discord_message_id': row[4],
+            'created_at': row[5]
+        }
+        for row in results
+    ]
+
+def get_episode_history_ids(anime_id: int) -> set:
+    """Bir animenin canlı tablodaki bölüm geçmişi kayıt id'lerini getir"""
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    c.execute("SELECT id FROM episode_history WHERE anime_id = ?", (anime_id,))
+    ids = {row[0] for row in c.fetchall()}
+    conn.close()
+    return ids
 
 def update_episode_history(anime_id: int, episode_number: int, episode_title: str, 
                           wordpress_post_id: int, discord_message_id: int) -> bool:
@@ -195,19 +535,209 @@ def update_episode_history(anime_id: int, episode_number: int, episode_title: st
         """, (episode_number, anime_id))
         
         conn.commit()
-        logger.info(f"Bölüm geçmişi güncellendi: Anime ID {anime_id}, Bölüm {episode_number}")
+        invalidate_tracked_anime_cache()
+        logger.info("Bölüm geçmişi güncellendi: Anime ID %s, Bölüm %s", anime_id, episode_number)
+        return True
+    except Exception as e:
+        logger.error("Bölüm geçmişi güncellenirken hata: %s", e)
+        return False
+    finally:
+        conn.close()
+
+def add_episode_history_bulk(anime_id: int, episodes: List[tuple]) -> bool:
+    """Birden çok bölümü tek işlemde bölüm geçmişine ekle
+    
+    `episodes` öğeleri (episode_number, episode_title, wordpress_post_id, discord_message_id) biçimindedir.
+    """
+    if not episodes:
+        return True
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    try:
+        c.executemany("""
+            INSERT INTO episode_history 
+            (anime_id, episode_number, episode_title, wordpress_post_id, discord_message_id) 
+            VALUES (?, ?, ?, ?, ?)
+        """, [(anime_id, *episode) for episode in episodes])
+        
+        # Son bölüm numarasını güncelle
+        c.execute("""
+            UPDATE anime_tracking 
+            SET last_episode = ?, updated_at = CURRENT_TIMESTAMP 
+            WHERE anilist_id = ?
+        """, (max(episode[0] for episode in episodes), anime_id))
+        
+        conn.commit()
+        invalidate_tracked_anime_cache()
+        logger.info("Bölüm geçmişi güncellendi: Anime ID %s, %s bölüm", anime_id, len(episodes))
         return True
     except Exception as e:
-        logger.error(f"Bölüm geçmişi güncellenirken hata: {e}")
+        conn.rollback()
+        logger.error("Bölüm geçmişi güncellenirken hata: %s", e)
         return False
     finally:
         conn.close()
 
+def _archive_path_for(created_at: str) -> str:
+    """Kaydın oluşturulduğu aya ait arşiv dosyasının yolunu döndür"""
+    return os.path.join(HISTORY_ARCHIVE_DIR, f"episode_history_{created_at[:7]}.jsonl.gz")
+
+def _archive_files() -> List[str]:
+    """Arşiv dizinindeki aylık arşiv dosyalarının adlarını getir"""
+    if not os.path.isdir(HISTORY_ARCHIVE_DIR):
+        return []
+    return sorted(filename for filename in os.listdir(HISTORY_ARCHIVE_DIR) if filename.endswith('.jsonl.gz'))
+
+def _read_archive_file(filename: str):
+    """Arşiv dosyasındaki kayıtları sırayla döndür; bozuk/yarım kuyrukta dur"""
+    try:
+        with gzip.open(os.path.join(HISTORY_ARCHIVE_DIR, filename), 'rt', encoding='utf-8') as archive:
+            for line in archive:
+                yield json.loads(line)
+    except ARCHIVE_READ_ERRORS as e:
+        # Ör. kapanış sırasında kesilmiş bir ekleme; o ana kadarki kayıtlar geçerlidir
+        logger.warning("Arşiv dosyası tam okunamadı (%s): %s", filename, e)
+
+def _save_archive_index(index: Dict[str, List[str]]):
+    """Anime ID -> arşiv dosyaları dizinini atomik olarak yaz"""
+    path = os.path.join(HISTORY_ARCHIVE_DIR, HISTORY_ARCHIVE_INDEX)
+    with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(f"{path}.tmp", path)
+
+def load_archive_index() -> Dict[str, List[str]]:
+    """Hangi animenin hangi arşiv dosyalarında kaydı olduğunu getir
+    
+    Dizin yoksa (ör. dizin öncesi oluşmuş arşivler) tüm dosyalar bir kez
+    taranarak yeniden oluşturulur.
+    """
+    path = os.path.join(HISTORY_ARCHIVE_DIR, HISTORY_ARCHIVE_INDEX)
+    with history_archive_lock:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.error("Arşiv dizini okunamadı, yeniden oluşturuluyor: %s", e)
+        
+        index: Dict[str, List[str]] = {}
+        filenames = _archive_files()
+        for filename in filenames:
+            for anime_key in {str(record['anime_id']) for record in _read_archive_file(filename)}:
+                index.setdefault(anime_key, []).append(filename)
+        if filenames:
+            _save_archive_index(index)
+        return index
+
+def archive_episode_history(retention_days: int) -> int:
+    """Saklama süresinden eski bölüm geçmişini sıkıştırılmış JSONL arşivine taşı
+    
+    Satırlar önce aylık `.jsonl.gz` dosyalarına eklenir, ardından veritabanından
+    silinir. İkisi arasında kesilirse tekrar eden satırlar okuma sırasında id
+    ile tekilleştirilir.
+    """
+    os.makedirs(HISTORY_ARCHIVE_DIR, exist_ok=True)
+    index = load_archive_index()
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    archived = 0
+    try:
+        while True:
+            c.execute("""
+                SELECT id, anime_id, episode_number, episode_title, wordpress_post_id, discord_message_id, created_at 
+                FROM episode_history 
+                WHERE created_at < datetime('now', ?) 
+                ORDER BY id 
+                LIMIT ?
+            """, (f'-{retention_days} days', HISTORY_ARCHIVE_BATCH))
+            rows = c.fetchall()
+            if not rows:
+                break
+            
+            by_file: Dict[str, list] = {}
+            for row in rows:
+                record = {
+                    'id': row[0],
+                    'anime_id': row[1],
+                    'episode_number': row[2],
+                    'episode_title': row[3],
+                    'wordpress_post_id': row[4],
+                    'discord_message_id': row[5],
+                    'created_at': row[6]
+                }
+                by_file.setdefault(_archive_path_for(row[6]), []).append(record)
+            
+            # gzip üyeleri art arda eklenebilir; gzip.open hepsini tek akış olarak okur
+            with history_archive_lock:
+                for path, records in by_file.items():
+                    with gzip.open(path, 'at', encoding='utf-8') as archive:
+                        for record in records:
+                            archive.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    filename = os.path.basename(path)
+                    for anime_key in {str(record['anime_id']) for record in records}:
+                        if filename not in index.setdefault(anime_key, []):
+                            index[anime_key].append(filename)
+                # Dizin satırlar silinmeden önce yazılır; fazladan dosya listelemek zararsızdır
+                _save_archive_index(index)
+            
+            c.executemany("DELETE FROM episode_history WHERE id = ?", [(row[0],) for row in rows])
+            conn.commit()
+            archived += len(rows)
+    finally:
+        conn.close()
+    
+    if archived:
+        logger.info("%s bölüm geçmişi kaydı arşivlendi", archived)
+    return archived
+
+def load_archived_episode_history(anime_id: int, exclude_ids: Optional[set] = None) -> List[Dict[str, Any]]:
+    """Bir animenin arşivlenmiş bölüm geçmişini (episode_number, id) sırasıyla getir
+    
+    Yalnızca dizinde bu animeye ait görünen dosyalar açılır. `exclude_ids`
+    canlı tabloda hâlâ duran (arşivlenip silinememiş) satırları dışarıda bırakır.
+    """
+    if not os.path.isdir(HISTORY_ARCHIVE_DIR):
+        return []
+    
+    exclude_ids = exclude_ids or set()
+    records = {}
+    with history_archive_lock:
+        for filename in load_archive_index().get(str(anime_id), []):
+            if not os.path.exists(os.path.join(HISTORY_ARCHIVE_DIR, filename)):
+                continue
+            for record in _read_archive_file(filename):
+                if record['anime_id'] == anime_id and record['id'] not in exclude_ids:
+                    records[record['id']] = record
+    
+    return sorted(records.values(), key=lambda record: (record['episode_number'], record['id']))
+
+def incremental_vacuum(max_pages: Optional[int] = None) -> int:
+    """Boş sayfaları dosya sisteminden geri ver ve geri verilen sayfa sayısını döndür"""
+    conn = sqlite3.connect(DATABASE_NAME)
+    c = conn.cursor()
+    c.execute("PRAGMA freelist_count")
+    before = c.fetchone()[0]
+    if before:
+        # execute() pragmayı yalnızca bir adım çalıştırır (tek sayfa); executescript
+        # ifadeyi sonuna kadar yürütür
+        if max_pages:
+            conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+        else:
+            conn.executescript("PRAGMA incremental_vacuum;")
+    c.execute("PRAGMA freelist_count")
+    after = c.fetchone()[0]
+    conn.close()
+    if before:
+        logger.info("Artımlı vacuum: boş sayfa sayısı %s -> %s", before, after)
+    return before - after
+
 # --- 4. Ortam Değişkenlerini Yükleme ---
 def check_and_load_environment_variables():
     """Ortam değişkenlerini yükle ve kontrol et"""
     global DISCORD_BOT_TOKEN, WORDPRESS_USERNAME, WORDPRESS_APP_PASSWORD
-    global WORDPRESS_API_URL, TARGET_CHANNEL_ID, AUTHORIZED_USER_IDS, PURGE_CHANNEL_ID, MOVIFOX_API_URL
+    global WORDPRESS_API_URL, TARGET_CHANNEL_ID, AUTHORIZED_USER_IDS, PURGE_CHANNEL_ID, MOVIFOX_API_URL, MOVIFOX_API_KEY
+    global PURGE_RETENTION_DAYS, HISTORY_RETENTION_DAYS
     
     init_db()
     load_dotenv()
@@ -217,10 +747,13 @@ def check_and_load_environment_variables():
     WORDPRESS_APP_PASSWORD = os.getenv("WORDPRESS_APP_PASSWORD")
     WORDPRESS_API_URL = os.getenv("WORDPRESS_API_URL")
     MOVIFOX_API_URL = os.getenv("MOVIFOX_API_URL")
+    MOVIFOX_API_KEY = os.getenv("MOVIFOX_API_KEY")
 
     # Kanal ID'lerini veritabanından yükle
     TARGET_CHANNEL_ID = int(get_config('TARGET_CHANNEL_ID')) if get_config('TARGET_CHANNEL_ID') else int(os.getenv("TARGET_CHANNEL_ID")) if os.getenv("TARGET_CHANNEL_ID") else None
     PURGE_CHANNEL_ID = int(get_config('PURGE_CHANNEL_ID')) if get_config('PURGE_CHANNEL_ID') else int(os.getenv("PURGE_CHANNEL_ID")) if os.getenv("PURGE_CHANNEL_ID") else None
+    PURGE_RETENTION_DAYS = int(get_config('PURGE_RETENTION_DAYS')) if get_config('PURGE_RETENTION_DAYS') else int(os.getenv("PURGE_RETENTION_DAYS")) if os.getenv("PURGE_RETENTION_DAYS") else None
+    HISTORY_RETENTION_DAYS = int(get_config('HISTORY_RETENTION_DAYS')) if get_config('HISTORY_RETENTION_DAYS') else int(os.getenv("HISTORY_RETENTION_DAYS")) if os.getenv("HISTORY_RETENTION_DAYS") else None
 
     # Yetkili kullanıcı ID'lerini yükle
     auth_users_str = get_config('AUTHORIZED_USER_IDS') if get_config('AUTHORIZED_USER_IDS') else os.getenv("AUTHORIZED_USER_IDS")
@@ -237,37 +770,201 @@ def check_and_load_environment_variables():
     
     missing_vars = [key for key, value in required_vars.items() if not value]
     if missing_vars:
-        logger.critical(f"Eksik ortam değişkenleri: {', '.join(missing_vars)}")
+        logger.critical("Eksik ortam değişkenleri: %s", ', '.join(missing_vars))
         return False
 
     logger.info("Ortam değişkenleri başarıyla yüklendi.")
     return True
 
-# --- 5. WordPress API Fonksiyonları ---
+# --- 5. Devre Kesiciler ---
+ANILIST_TIMEOUT = float(os.getenv("ANILIST_TIMEOUT", "8"))
+ANILIST_RETRIES = int(os.getenv("ANILIST_RETRIES", "2"))
+# 0 ise hedged istek kapalıdır; AniList hız sınırı nedeniyle varsayılan kapalı
+ANILIST_HEDGE_DELAY = float(os.getenv("ANILIST_HEDGE_DELAY", "0"))
+WORDPRESS_TIMEOUT = float(os.getenv("WORDPRESS_TIMEOUT", "15"))
+WORDPRESS_UPLOAD_TIMEOUT = float(os.getenv("WORDPRESS_UPLOAD_TIMEOUT", "60"))
+WORDPRESS_RETRIES = int(os.getenv("WORDPRESS_RETRIES", "2"))
+WORDPRESS_BATCH_TIMEOUT = float(os.getenv("WORDPRESS_BATCH_TIMEOUT", "60"))
+RETRY_BASE_DELAY = 0.5
+
+class CircuitOpenError(Exception):
+    """Devre kesici açıkken yapılan çağrılarda fırlatılır"""
+    
+    def __init__(self, breaker):
+        self.breaker = breaker
+        super().__init__(f"{breaker.name} devre kesicisi açık ({breaker.retry_after():.0f}sn)")
+
+class TransientError(Exception):
+    """Tekrar denenebilir sunucu hatası (5xx / 429)"""
+
+class CircuitBreaker:
+    """Kapalı / açık / yarı açık durumlu basit devre kesici
+    
+    Art arda `failure_threshold` hata alınınca devre açılır ve çağrılar
+    `reset_timeout` saniye boyunca hemen reddedilir. Süre dolunca tek bir
+    deneme çağrısına izin verilir (yarı açık); başarılıysa devre kapanır.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+    
+    def retry_after(self) -> float:
+        if self._state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+    
+    def check(self):
+        """Devre açıksa çağrı hakkı almadan hemen hata fırlat"""
+        if self.state == self.OPEN:
+            raise CircuitOpenError(self)
+    
+    def acquire(self):
+        """Çağrı hakkı al; yarı açık durumda yalnızca tek deneme çağrısı geçer"""
+        state = self.state
+        if state == self.OPEN or (state == self.HALF_OPEN and self._trial_in_flight):
+            raise CircuitOpenError(self)
+        if state == self.HALF_OPEN:
+            self._trial_in_flight = True
+    
+    def record_success(self):
+        self._state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+    
+    def record_failure(self):
+        self._failures += 1
+        self._trial_in_flight = False
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                logger.warning("%s devre kesicisi açıldı (%s hata)", self.name, self._failures)
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+    
+    def release(self):
+        """Sonucu belirsiz bir çağrıdan sonra deneme hakkını geri bırak"""
+        self._trial_in_flight = False
+
+anilist_breaker = CircuitBreaker('AniList')
+wordpress_breaker = CircuitBreaker('WordPress')
+CIRCUIT_BREAKERS = [anilist_breaker, wordpress_breaker]
+
+RETRYABLE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, TransientError)
+
+async def _hedged_call(operation, timeout: float, hedge_delay: float):
+    """İlk istek `hedge_delay` sonunda hâlâ sürüyorsa ikinci bir kopya başlat, ilk başarılıyı döndür"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    pending = {asyncio.ensure_future(operation())}
+    hedged = False
+    last_error = None
+    try:
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError()
+            wait_for = min(remaining, hedge_delay) if not hedged else remaining
+            done, pending = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                last_error = task.exception()
+            if not hedged:
+                if not pending:
+                    # İlk istek gecikmeden önce başarısız oldu; kopya göndermek yerine
+                    # hatayı call_with_breaker'ın jitter'lı tekrarına bırak
+                    break
+                hedged = True
+                pending.add(asyncio.ensure_future(operation()))
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
+
+async def call_with_breaker(breaker: CircuitBreaker, operation, timeout: float,
+                            retries: int = 0, hedge_delay: float = 0):
+    """İşlemi devre kesici, süre sınırı ve jitter'lı sınırlı tekrar ile çalıştır
+    
+    `operation` her denemede yeni bir coroutine üreten argümansız bir fonksiyondur.
+    Yalnızca RETRYABLE_ERRORS devre kesiciye hata olarak sayılır ve tekrar denenir.
+    """
+    attempt = 0
+    while True:
+        breaker.acquire()
+        outcome = None
+        try:
+            if hedge_delay > 0:
+                result = await _hedged_call(operation, timeout, hedge_delay)
+            else:
+                result = await asyncio.wait_for(operation(), timeout)
+            outcome = True
+            return result
+        except RETRYABLE_ERRORS:
+            outcome = False
+            if attempt >= retries:
+                raise
+        finally:
+            if outcome is True:
+                breaker.record_success()
+            elif outcome is False:
+                breaker.record_failure()
+            else:
+                breaker.release()
+        
+        attempt += 1
+        # Full jitter: 0 ile üstel gecikme arasında rastgele bekle
+        await asyncio.sleep(random.uniform(0, RETRY_BASE_DELAY * 2 ** attempt))
+
+# --- 6. WordPress API Fonksiyonları ---
 def get_wordpress_auth_headers():
     """WordPress API için kimlik doğrulama başlıkları"""
     credentials = f"{WORDPRESS_USERNAME}:{WORDPRESS_APP_PASSWORD}"
     token = base64.b64encode(credentials.encode()).decode()
     return {'Authorization': f'Basic {token}', 'Content-Type': 'application/json'}
 
+def _raise_for_transient(status: int, service: str):
+    """Tekrar denenebilir HTTP durumlarında TransientError fırlat"""
+    if status == 429 or status >= 500:
+        raise TransientError(f"{service} {status}")
+
 async def get_wordpress_posts(page=1, per_page=100, status='publish'):
     """WordPress'ten gönderileri al"""
     url = f"{WORDPRESS_API_URL}/wp-json/wp/v2/posts?page={page}&per_page={per_page}&status={status}"
     headers = get_wordpress_auth_headers()
     
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                logger.error(f"WordPress gönderileri alınırken hata: {response.status}")
+    async def request():
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    return await response.json()
+                _raise_for_transient(response.status, 'WordPress')
+                logger.error("WordPress gönderileri alınırken hata: %s", response.status)
                 return None
-
-async def create_wordpress_post(title, content, status='publish', categories=None, tags=None, featured_media=None):
-    """WordPress'te yeni gönderi oluştur"""
-    url = f"{WORDPRESS_API_URL}/wp-json/wp/v2/posts"
-    headers = get_wordpress_auth_headers()
     
+    try:
+        return await call_with_breaker(wordpress_breaker, request, timeout=WORDPRESS_TIMEOUT, retries=WORDPRESS_RETRIES)
+    except RETRYABLE_ERRORS as e:
+        logger.error("WordPress gönderileri alınırken hata: %s", e)
+        return None
+
+def build_wordpress_post_data(title, content, status='publish', categories=None, tags=None, featured_media=None):
+    """WordPress gönderi gövdesini oluştur (tekil ve batch istekler ortak kullanır)"""
     data = {
         'title': title,
         'content': content,
@@ -280,15 +977,30 @@ async def create_wordpress_post(title, content, status='publish', categories=Non
         data['tags'] = tags
     if featured_media:
         data['featured_media'] = featured_media
+    return data
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, json=data) as response:
-            if response.status == 201:
-                return await response.json()
-            else:
+async def create_wordpress_post(title, content, status='publish', categories=None, tags=None, featured_media=None):
+    """WordPress'te yeni gönderi oluştur"""
+    url = f"{WORDPRESS_API_URL}/wp-json/wp/v2/posts"
+    headers = get_wordpress_auth_headers()
+    data = build_wordpress_post_data(title, content, status, categories, tags, featured_media)
+
+    async def request():
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, headers=headers, json=data) as response:
+                if response.status == 201:
+                    return await response.json()
+                _raise_for_transient(response.status, 'WordPress')
                 error_text = await response.text()
-                logger.error(f"WordPress gönderisi oluşturulurken hata: {response.status} - {error_text}")
+                logger.error("WordPress gönderisi oluşturulurken hata: %s - %s", response.status, error_text)
                 return None
+    
+    # POST idempotent değildir; çift gönderi oluşmaması için tekrar denenmez
+    try:
+        return await call_with_breaker(wordpress_breaker, request, timeout=WORDPRESS_TIMEOUT)
+    except RETRYABLE_ERRORS as e:
+        logger.error("WordPress gönderisi oluşturulurken hata: %s", e)
+        return None
 
 async def upload_media_to_wordpress(file_bytes, filename, mime_type):
     """WordPress'e medya yükle"""
@@ -297,16 +1009,112 @@ async def upload_media_to_wordpress(file_bytes, filename, mime_type):
     headers['Content-Disposition'] = f'attachment; filename="{filename}"'
     headers['Content-Type'] = mime_type
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(url, headers=headers, data=file_bytes) as response:
-            if response.status == 201:
-                return await response.json()
-            else:
+    async def request():
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, headers=headers, data=file_bytes) as response:
+                if response.status == 201:
+                    return await response.json()
+                _raise_for_transient(response.status, 'WordPress')
                 error_text = await response.text()
-                logger.error(f"WordPress medyası yüklenirken hata: {response.status} - {error_text}")
+                logger.error("WordPress medyası yüklenirken hata: %s - %s", response.status, error_text)
                 return None
+    
+    try:
+        return await call_with_breaker(wordpress_breaker, request, timeout=WORDPRESS_UPLOAD_TIMEOUT)
+    except RETRYABLE_ERRORS as e:
+        logger.error("WordPress medyası yüklenirken hata: %s", e)
+        return None
+
+# WordPress batch API tek istekte en fazla 25 alt isteği kabul eder
+WORDPRESS_BATCH_SIZE = 25
+WORDPRESS_POST_CONCURRENCY = 5
+# None: henüz denenmedi, False: site batch uç noktasını desteklemiyor
+wordpress_batch_supported: Optional[bool] = None
+
+async def create_wordpress_posts_batch(posts: List[Dict[str, Any]]) -> Optional[List[Optional[Dict[str, Any]]]]:
+    """En fazla 25 gönderiyi /wp-json/batch/v1 üzerinden tek istekte oluştur
+    
+    Her gönderi için oluşturulan post ya da None döner; site batch API'yi
+    desteklemiyorsa sonuç listesi yerine None döner.
+    """
+    url = f"{WORDPRESS_API_URL}/wp-json/batch/v1"
+    headers = get_wordpress_auth_headers()
+    payload = {
+        'validation': 'normal',
+        'requests': [{'method': 'POST', 'path': '/wp/v2/posts', 'body': build_wordpress_post_data(**post)} for post in posts]
+    }
+    
+    async def request():
+        async with aiohttp.ClientSession() as session:
+            async with session.post(url, headers=headers, json=payload) as response:
+                if response.status in (404, 405):
+                    return None
+                if response.status in (200, 207):
+                    data = await response.json()
+                    responses = data.get('responses') or []
+                    results = []
+                    for index in range(len(posts)):
+                        item = responses[index] if index < len(responses) else None
+                        if item and 200 <= item.get('status', 0) < 300:
+                            results.append(item.get('body'))
+                        else:
+                            logger.error("WordPress batch gönderisi oluşturulamadı: %s", item.get('body') if item else data.get('failed'))
+                            results.append(None)
+                    return results
+                _raise_for_transient(response.status, 'WordPress')
+                error_text = await response.text()
+                logger.error("WordPress batch isteğinde hata: %s - %s", response.status, error_text)
+                return [None] * len(posts)
+    
+    # POST idempotent değildir; çift gönderi oluşmaması için tekrar denenmez
+    try:
+        return await call_with_breaker(wordpress_breaker, request, timeout=WORDPRESS_BATCH_TIMEOUT)
+    except RETRYABLE_ERRORS as e:
+        logger.error("WordPress batch isteğinde hata: %s", e)
+        return [None] * len(posts)
 
-# --- 6. AniList API Fonksiyonları ---
+async def create_wordpress_posts(posts: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    """Birden çok gönderiyi batch API ile, desteklenmiyorsa eşzamanlı tekil isteklerle oluştur
+    
+    `posts` öğeleri create_wordpress_post argümanlarıdır; sonuçlar aynı sırayla döner.
+    Devre kesici işlem ortasında açılırsa kalan gönderiler None olarak döner,
+    böylece çağıran taraf oluşturulmuş gönderileri yine de kaydedebilir.
+    """
+    global wordpress_batch_supported
+    results = []
+    
+    if wordpress_batch_supported is not False:
+        for start in range(0, len(posts), WORDPRESS_BATCH_SIZE):
+            try:
+                chunk_results = await create_wordpress_posts_batch(posts[start:start + WORDPRESS_BATCH_SIZE])
+            except CircuitOpenError as e:
+                logger.warning("WordPress batch gönderimi durduruldu: %s", e)
+                return results + [None] * (len(posts) - len(results))
+            if chunk_results is None:
+                wordpress_batch_supported = False
+                logger.info("WordPress batch API desteklenmiyor, tekil isteklere geçiliyor")
+                break
+            wordpress_batch_supported = True
+            results.extend(chunk_results)
+        else:
+            return results
+    
+    semaphore = asyncio.Semaphore(WORDPRESS_POST_CONCURRENCY)
+    
+    async def create_one(post):
+        async with semaphore:
+            return await create_wordpress_post(**post)
+    
+    outcomes = await asyncio.gather(*(create_one(post) for post in posts[len(results):]), return_exceptions=True)
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            logger.error("WordPress gönderisi oluşturulurken hata: %s", outcome)
+            results.append(None)
+        else:
+            results.append(outcome)
+    return results
+
+# --- 7. AniList API Fonksiyonları ---
 async def get_anilist_data(query, variables):
     """AniList API'den veri al"""
     headers = {
@@ -315,44 +1123,50 @@ async def get_anilist_data(query, variables):
     }
     data = {'query': query, 'variables': variables}
     
-    async with aiohttp.ClientSession() as session:
-        async with session.post(ANILIST_API_URL, headers=headers, json=data) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                logger.error(f"AniList API çağrılırken hata: {response.status}")
+    async def request():
+        async with aiohttp.ClientSession() as session:
+            async with session.post(ANILIST_API_URL, headers=headers, json=data) as response:
+                if response.status == 200:
+                    return await response.json()
+                _raise_for_transient(response.status, 'AniList')
+                logger.error("AniList API çağrılırken hata: %s", response.status)
                 return None
+    
+    # GraphQL sorguları salt okunurdur; tekrar ve hedged istek güvenlidir
+    try:
+        return await call_with_breaker(anilist_breaker, request, timeout=ANILIST_TIMEOUT,
+                                       retries=ANILIST_RETRIES, hedge_delay=ANILIST_HEDGE_DELAY)
+    except RETRYABLE_ERRORS as e:
+        logger.error("AniList API çağrılırken hata: %s", e)
+        return None
 
-async def get_anilist_anime_info(anime_id=None, search_query=None):
-    """AniList'ten anime bilgilerini al"""
-    query = """
-    query ($id: Int, $search: String) {
-      Media(id: $id, search: $search, type: ANIME) {
-        id
-        title {
+# Media alanlarının GraphQL parçaları; profiller bu parçalardan derlenir
+ANILIST_MEDIA_FIELDS = {
+    'id': "id",
+    'title': """title {
           romaji
           english
           native
-        }
-        description(asHtml: false)
-        episodes
-        status
-        startDate { year month day }
-        endDate { year month day }
-        season
-        seasonYear
-        coverImage {
+        }""",
+    'description': "description(asHtml: false)",
+    'episodes': "episodes",
+    'status': "status",
+    'startDate': "startDate { year month day }",
+    'endDate': "endDate { year month day }",
+    'season': "season",
+    'seasonYear': "seasonYear",
+    'coverImage': """coverImage {
           extraLarge
           large
           medium
           color
-        }
-        bannerImage
-        genres
-        tags {
+        }""",
+    'bannerImage': "bannerImage",
+    'genres': "genres",
+    'tags': """tags {
           name
-        }
-        relations {
+        }""",
+    'relations': """relations {
           edges {
             node {
               type
@@ -363,12 +1177,12 @@ async def get_anilist_anime_info(anime_id=None, search_query=None):
             }
             relationType
           }
-        }
-        externalLinks {
+        }""",
+    'externalLinks': """externalLinks {
           site
           url
-        }
-        characters {
+        }""",
+    'characters': """characters {
           edges {
             node {
               name {
@@ -376,8 +1190,8 @@ async def get_anilist_anime_info(anime_id=None, search_query=None):
               }
             }
           }
-        }
-        staff {
+        }""",
+    'staff': """staff {
           edges {
             node {
               name {
@@ -385,26 +1199,87 @@ async def get_anilist_anime_info(anime_id=None, search_query=None):
               }
             }
           }
-        }
-        studios(isMain: true) {
+        }""",
+    'studios': """studios(isMain: true) {
           nodes {
             name
           }
-        }
-      }
-    }
+        }""",
+}
+
+# Çağrı yerine göre istenecek alan kümeleri
+ANILIST_QUERY_PROFILES = {
+    'minimal': ('id', 'title'),
+    'notify': ('id', 'title', 'episodes', 'status'),
+    'embed': ('id', 'title', 'description', 'episodes', 'status', 'seasonYear',
+              'coverImage', 'bannerImage', 'genres'),
+    'full': tuple(ANILIST_MEDIA_FIELDS),
+}
+
+def _compile_media_query(fields):
+    """Alan listesinden Media sorgusunu oluştur"""
+    body = "\n        ".join(ANILIST_MEDIA_FIELDS[field] for field in fields)
+    return f"""
+    query ($id: Int, $search: String) {{
+      Media(id: $id, search: $search, type: ANIME) {{
+        {body}
+      }}
+    }}
+    """
+
+ANILIST_MEDIA_QUERIES = {name: _compile_media_query(fields) for name, fields in ANILIST_QUERY_PROFILES.items()}
+ANILIST_PROFILE_FIELDS = {name: frozenset(fields) for name, fields in ANILIST_QUERY_PROFILES.items()}
+
+# AniList ID -> (alan kümesi, veri, son geçerlilik zamanı)
+ANILIST_CACHE_TTL = int(os.getenv("ANILIST_CACHE_TTL", "600"))
+anilist_media_cache: Dict[int, tuple] = {}
+
+def get_cached_anime_info(anime_id: int, profile: str = 'full') -> Optional[Dict[str, Any]]:
+    """Önbellekte istenen profili karşılayan geçerli bir kayıt varsa döndür"""
+    entry = anilist_media_cache.get(anime_id)
+    if not entry:
+        return None
+    fields, data, expires_at = entry
+    if expires_at < time.monotonic():
+        del anilist_media_cache[anime_id]
+        return None
+    # Daha geniş bir profil önbellekteyse daha küçük profil de ondan karşılanır
+    if ANILIST_PROFILE_FIELDS[profile] <= fields:
+        return data
+    return None
+
+def cache_anime_info(data: Dict[str, Any], profile: str):
+    """AniList yanıtını önbelleğe yaz; geçerli daha geniş bir kaydı daraltma"""
+    fields = ANILIST_PROFILE_FIELDS[profile]
+    entry = anilist_media_cache.get(data['id'])
+    if entry and entry[2] >= time.monotonic() and fields < entry[0]:
+        return
+    anilist_media_cache[data['id']] = (fields, data, time.monotonic() + ANILIST_CACHE_TTL)
+
+async def get_anilist_anime_info(anime_id=None, search_query=None, profile='full'):
+    """AniList'ten anime bilgilerini al
+    
+    `profile` istenecek alan kümesini seçer: minimal, notify, embed veya full.
     """
+    if profile not in ANILIST_MEDIA_QUERIES:
+        raise ValueError(f"Bilinmeyen AniList sorgu profili: {profile}")
     
     variables = {}
     if anime_id:
+        cached = get_cached_anime_info(anime_id, profile)
+        if cached:
+            return cached
         variables['id'] = anime_id
     elif search_query:
         variables['search'] = search_query
     else:
         return None
 
-    data = await get_anilist_data(query, variables)
-    return data['data']['Media'] if data and 'data' in data else None
+    data = await get_anilist_data(ANILIST_MEDIA_QUERIES[profile], variables)
+    media = data['data']['Media'] if data and 'data' in data else None
+    if media:
+        cache_anime_info(media, profile)
+    return media
 
 async def search_anilist_anime(search_query, limit=10):
     """AniList'te anime ara"""
@@ -433,7 +1308,116 @@ async def search_anilist_anime(search_query, limit=10):
     data = await get_anilist_data(query, variables)
     return data['data']['Page']['media'] if data and 'data' in data else []
 
-# --- 7. Yardımcı Fonksiyonlar ---
+# --- 8. Movifox API Fonksiyonları ---
+# Varsayılan sözleşme (Movifox tarafında doğrulanmalıdır):
+#   GET {MOVIFOX_API_URL}{MOVIFOX_AVAILABILITY_PATH}?anilist_ids=1,2,3
+#   Authorization: Bearer {MOVIFOX_API_KEY}
+#   -> {"results": {"<anilist_id>": {"url": "...", "episodes": 12}}}
+#      veya {"results": [{"anilist_id": 1, "url": "...", "episodes": 12}]}
+MOVIFOX_AVAILABILITY_PATH = os.getenv("MOVIFOX_AVAILABILITY_PATH", "/api/v1/availability")
+MOVIFOX_BATCH_SIZE = 50
+MOVIFOX_CACHE_TTL = int(os.getenv("MOVIFOX_CACHE_TTL", "900"))
+
+# AniList ID -> (erişilebilirlik verisi veya None, son geçerlilik zamanı)
+movifox_availability_cache: Dict[int, tuple] = {}
+movifox_session: Optional[aiohttp.ClientSession] = None
+
+def get_movifox_session() -> aiohttp.ClientSession:
+    """Movifox için bağlantı havuzlu paylaşılan oturumu getir"""
+    global movifox_session
+    if movifox_session is None or movifox_session.closed:
+        headers = {'Accept': 'application/json'}
+        if MOVIFOX_API_KEY:
+            headers['Authorization'] = f'Bearer {MOVIFOX_API_KEY}'
+        movifox_session = aiohttp.ClientSession(
+            headers=headers,
+            connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+    return movifox_session
+
+async def close_movifox_session():
+    """Paylaşılan Movifox oturumunu kapat"""
+    if movifox_session is not None and not movifox_session.closed:
+        await movifox_session.close()
+
+async def fetch_movifox_availability(anilist_ids: List[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+    """Movifox'tan bir grup anime için yayın erişilebilirliğini tek istekte al"""
+    url = f"{MOVIFOX_API_URL}{MOVIFOX_AVAILABILITY_PATH}"
+    params = {'anilist_ids': ",".join(str(anilist_id) for anilist_id in anilist_ids)}
+    
+    try:
+        async with get_movifox_session().get(url, params=params) as response:
+            if response.status != 200:
+                logger.error("Movifox API çağrılırken hata: %s", response.status)
+                return {}
+            data = await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logger.error("Movifox API çağrılırken hata: %s", e)
+        return {}
+    
+    # Yanıt {"results": {"<id>": {...}}} veya {"results": [{"anilist_id": ..., ...}]} olabilir;
+    # beklenmeyen biçimdeki kayıtlar yok sayılır
+    try:
+        results = data.get('results', data) if isinstance(data, dict) else data
+        if isinstance(results, dict):
+            items = {int(key): value for key, value in results.items()
+                     if str(key).isdigit() and isinstance(value, dict)}
+        elif isinstance(results, list):
+            items = {int(item['anilist_id']): item for item in results
+                     if isinstance(item, dict) and str(item.get('anilist_id', '')).isdigit()}
+        else:
+            items = {}
+    except (TypeError, ValueError, KeyError) as e:
+        logger.error("Movifox yanıtı çözümlenemedi: %s", e)
+        return {}
+    
+    # Sonuç dönmeyen ID'ler de "erişilemez" olarak önbelleğe alınır
+    return {anilist_id: items.get(anilist_id) for anilist_id in anilist_ids}
+
+async def get_movifox_availability(anilist_ids: List[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+    """Önbellekte olmayan ID'leri gruplar halinde eşzamanlı sorgulayıp erişilebilirliği döndür"""
+    if not MOVIFOX_API_URL or not anilist_ids:
+        return {}
+    
+    now = time.monotonic()
+    availability = {}
+    missing = []
+    for anilist_id in dict.fromkeys(anilist_ids):
+        entry = movifox_availability_cache.get(anilist_id)
+        if entry and entry[1] >= now:
+            availability[anilist_id] = entry[0]
+        else:
+            missing.append(anilist_id)
+    
+    if missing:
+        batches = [missing[i:i + MOVIFOX_BATCH_SIZE] for i in range(0, len(missing), MOVIFOX_BATCH_SIZE)]
+        for fetched in await asyncio.gather(*(fetch_movifox_availability(batch) for batch in batches)):
+            expires_at = time.monotonic() + MOVIFOX_CACHE_TTL
+            for anilist_id, item in fetched.items():
+                movifox_availability_cache[anilist_id] = (item, expires_at)
+                availability[anilist_id] = item
+    
+    return availability
+
+async def await_movifox_availability(task: asyncio.Task) -> Dict[int, Optional[Dict[str, Any]]]:
+    """Önceden başlatılmış erişilebilirlik sorgusunu bekle; herhangi bir hatada boş sonuç döndür"""
+    try:
+        return await task
+    except Exception as e:
+        logger.warning("Movifox erişilebilirliği alınamadı: %s", e)
+        return {}
+
+def format_movifox_availability(item: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Erişilebilirlik kaydını tek satırlık metne çevir"""
+    if not isinstance(item, dict) or not item.get('url'):
+        return None
+    text = f"[Movifox'ta izle]({item['url']})"
+    if item.get('episodes'):
+        text += f" | {item['episodes']} bölüm mevcut"
+    return text
+
+# --- 9. Yardımcı Fonksiyonlar ---
 def sanitize_filename(name):
     """Dosya adını temizle"""
     return re.sub(r'[\\/:*?"<>|]', '', name)
@@ -441,15 +1425,16 @@ def sanitize_filename(name):
 async def download_image(url):
     """Resim indir"""
     try:
-        async with aiohttp.ClientSession() as session:
+        # AniList CDN'i takılırsa komut varsayılan 5 dakikalık süre boyunca beklemesin
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=ANILIST_TIMEOUT)) as session:
             async with session.get(url) as response:
                 if response.status == 200:
                     return BytesIO(await response.read())
                 else:
-                    logger.error(f"Resim indirilirken hata: {response.status}")
+                    logger.error("Resim indirilirken hata: %s", response.status)
                     return None
     except Exception as e:
-        logger.error(f"Resim indirilirken hata: {e}")
+        logger.error("Resim indirilirken hata: %s", e)
         return None
 
 def create_anime_embed(anime_data, episode_info=None):
@@ -489,20 +1474,174 @@ def create_anime_embed(anime_data, episode_info=None):
     
     return embed
 
-# --- 8. Discord Bot Komutları ---
+class KeysetPaginator(discord.ui.View):
+    """Keyset sayfalamalı listeler için ileri/geri butonlu görünüm
+    
+    `fetch_page(cursor)` bir sayfa satır döndürür, `cursor_of(row)` bir satırın
+    keyset değerini, `build_embed(rows, page)` ise sayfanın embed'ini üretir.
+    Geri gitmek için ziyaret edilen sayfaların başlangıç cursor'ları saklanır.
+    """
+    
+    def __init__(self, author_id: int, fetch_page, cursor_of, build_embed,
+                 total: int, page_size: int = 10, timeout: float = 120):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.fetch_page = fetch_page
+        self.cursor_of = cursor_of
+        self.build_embed = build_embed
+        self.page_size = page_size
+        self.total_pages = max(1, -(-total // page_size))
+        self.cursors = [None]
+        self.rows = []
+        self.message = None
+    
+    def _render(self):
+        page = len(self.cursors)
+        self.previous_button.disabled = page <= 1
+        self.next_button.disabled = len(self.rows) < self.page_size or page >= self.total_pages
+        return self.build_embed(self.rows, page, self.total_pages)
+    
+    async def start(self, ctx):
+        self.rows = self.fetch_page(None)
+        self.message = await ctx.send(embed=self._render(), view=self)
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("❌ Bu menüyü yalnızca komutu kullanan kişi kontrol edebilir.", ephemeral=True)
+            return False
+        return True
+    
+    async def on_timeout(self):
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass
+    
+    @discord.ui.button(label="◀️ Önceki", style=discord.ButtonStyle.secondary)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+        self.rows = self.fetch_page(self.cursors[-1])
+        await interaction.response.edit_message(embed=self._render(), view=self)
+    
+    @discord.ui.button(label="Sonraki ▶️", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.rows:
+            self.cursors.append(self.cursor_of(self.rows[-1]))
+            self.rows = self.fetch_page(self.cursors[-1])
+        await interaction.response.edit_message(embed=self._render(), view=self)
+
+# Discord yalnızca 14 günden yeni mesajları toplu silebilir; sınırda pay bırakılır
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+BULK_DELETE_CHUNK = 100
+PURGE_SINGLE_DELETE_DELAY = 1.2
+PURGE_PROGRESS_EVERY = 100
+PURGE_MAX_MESSAGES = 1000
+
+async def purge_channel_messages(channel, check=None, limit=None, before=None, progress=None) -> Dict[str, int]:
+    """Kanal geçmişini akış halinde gezip eşleşen mesajları sil
+    
+    14 günden yeni mesajlar 100'lük gruplar halinde `delete_messages` ile,
+    daha eskileri ise hız sınırına takılmamak için aralıklı tekil silme ile
+    kaldırılır. `progress(stats)` her PURGE_PROGRESS_EVERY silmede çağrılır.
+    """
+    stats = {'scanned': 0, 'bulk': 0, 'single': 0, 'failed': 0}
+    bulk_cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+    chunk = []
+    reported = 0
+    
+    async def flush():
+        nonlocal chunk
+        if not chunk:
+            return
+        try:
+            await channel.delete_messages(chunk)
+            stats['bulk'] += len(chunk)
+        except discord.HTTPException as e:
+            logger.error("Toplu mesaj silme hatası: %s", e)
+            stats['failed'] += len(chunk)
+        chunk = []
+    
+    async for message in channel.history(limit=limit, before=before):
+        stats['scanned'] += 1
+        if check and not check(message):
+            continue
+        
+        if message.created_at > bulk_cutoff:
+            chunk.append(message)
+            if len(chunk) >= BULK_DELETE_CHUNK:
+                await flush()
+        else:
+            # Geçmiş yeniden eskiye gelir; buradan sonrası toplu silinemez
+            await flush()
+            try:
+                await message.delete()
+                stats['single'] += 1
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                logger.error("Mesaj silme hatası (%s): %s", message.id, e)
+                stats['failed'] += 1
+            await asyncio.sleep(PURGE_SINGLE_DELETE_DELAY)
+        
+        deleted = stats['bulk'] + stats['single']
+        if progress and deleted - reported >= PURGE_PROGRESS_EVERY:
+            reported = deleted
+            await progress(stats)
+    
+    await flush()
+    return stats
+
+class PurgeFlags(commands.FlagConverter, prefix='--', delimiter=' '):
+    """!kanal-temizle filtreleri"""
+    author: Optional[discord.Member] = commands.flag(name='yazar', default=None)
+    older_than_days: Optional[int] = commands.flag(name='gün', default=None)
+    bot_only: bool = commands.flag(name='bot', default=False)
+
+MAX_EPISODE_RANGE = 100
+
+def parse_episode_range(spec: str) -> List[int]:
+    """'5' veya '1-24' biçimindeki bölüm ifadesini bölüm numaralarına çevir"""
+    match = re.fullmatch(r'\s*(\d+)\s*(?:-\s*(\d+))?\s*', spec)
+    if not match:
+        return []
+    first = int(match.group(1))
+    last = int(match.group(2)) if match.group(2) else first
+    if last < first or last - first + 1 > MAX_EPISODE_RANGE:
+        return []
+    return list(range(first, last + 1))
+
+def build_episode_post_content(title, episode_number, episode_title, watch_html=""):
+    """Bölüm postunun HTML içeriğini oluştur"""
+    return f"""
+    <h2>🎬 {title} - {episode_title}</h2>
+    
+    <h3>📊 Bölüm Bilgileri</h3>
+    <ul>
+        <li><strong>Bölüm:</strong> {episode_number}</li>
+        <li><strong>Başlık:</strong> {episode_title}</li>
+        <li><strong>Eklenme Tarihi:</strong> {datetime.now().strftime('%d.%m.%Y %H:%M')}</li>
+    </ul>
+    
+    <h3>📝 Açıklama</h3>
+    <p>Bu bölüm hakkında detaylı bilgi yakında eklenecek.</p>
+    {watch_html}
+    """
+
+# --- 10. Discord Bot Komutları ---
 @bot.event
 async def on_ready():
     """Bot hazır olduğunda çalışır"""
-    logger.info(f'{bot.user} Discord\'a giriş yaptı!')
+    logger.info("%s Discord'a giriş yaptı!", bot.user)
     print(f'🎭 {bot.user} olarak giriş yaptık!')
     print(f'📊 {len(bot.guilds)} sunucuda aktif')
     print(f'👥 {len(bot.users)} kullanıcıya hizmet veriyoruz')
     
-    # Durum mesajını ayarla
+    # Durum mesajını ayarla (periyodik görevler setup_hook'ta bir kez başlatılır)
     await bot.change_presence(activity=discord.Game(name="!yardım | Anime Takip"))
-    
-    # Periyodik görevleri başlat
-    anime_checker.start()
 
 @bot.event
 async def on_command_error(ctx, error):
@@ -513,8 +1652,11 @@ async def on_command_error(ctx, error):
         await ctx.send("❌ Bu komutu kullanmak için yetkiniz yok!")
     elif isinstance(error, commands.MissingRequiredArgument):
         await ctx.send(f"❌ Eksik parametre! Kullanım: `{ctx.command.usage}`")
+    elif isinstance(error, commands.CommandInvokeError) and isinstance(error.original, CircuitOpenError):
+        breaker = error.original.breaker
+        await ctx.send(f"⚠️ {breaker.name} şu anda yanıt vermiyor. Lütfen {max(1, round(breaker.retry_after()))} saniye sonra tekrar deneyin.")
     else:
-        logger.error(f"Komut hatası: {error}")
+        logger.error("Komut hatası: %s", error)
         await ctx.send("❌ Bir hata oluştu. Lütfen daha sonra tekrar deneyin.")
 
 @bot.command(name='ping')
@@ -565,7 +1707,7 @@ async def anime_info(ctx, anime_id: int):
     """AniList ID ile anime bilgilerini göster"""
     await ctx.send(f"🔍 Anime bilgileri alınıyor...")
     
-    anime_data = await get_anilist_anime_info(anime_id=anime_id)
+    anime_data = await get_anilist_anime_info(anime_id=anime_id, profile='embed')
     
     if not anime_data:
         await ctx.send("❌ Anime bulunamadı.")
@@ -578,10 +1720,11 @@ async def anime_info(ctx, anime_id: int):
 @commands.has_permissions(manage_messages=True)
 async def create_post(ctx, *, anime_name):
     """Anime için WordPress postu oluştur"""
+    wordpress_breaker.check()
     await ctx.send(f"🎬 '{anime_name}' için post oluşturuluyor...")
     
     # AniList'ten anime bilgilerini al
-    anime_data = await get_anilist_anime_info(search_query=anime_name)
+    anime_data = await get_anilist_anime_info(search_query=anime_name, profile='embed')
     
     if not anime_data:
         await ctx.send("❌ AniList'te anime bulunamadı.")
@@ -643,12 +1786,30 @@ async def create_post(ctx, *, anime_name):
 
 @bot.command(name='bölüm-ekle')
 @commands.has_permissions(manage_messages=True)
-async def add_episode(ctx, anime_id: int, episode_number: int, *, episode_title=None):
-    """Animeye yeni bölüm ekle"""
+async def add_episode(ctx, anime_id: int, episodes: str, *, episode_title=None):
+    """Animeye yeni bölüm veya bölüm aralığı (ör. 1-24) ekle"""
+    episode_numbers = parse_episode_range(episodes)
+    if not episode_numbers:
+        await ctx.send(f"❌ Geçersiz bölüm! Tek bölüm (`5`) veya en fazla {MAX_EPISODE_RANGE} bölümlük aralık (`1-24`) girin.")
+        return
+    
+    if len(episode_numbers) > 1 and episode_title:
+        await ctx.send("❌ Bölüm aralığı eklerken başlık verilemez; bölümler `Bölüm N` olarak adlandırılır.")
+        return
+    
+    wordpress_breaker.check()
+    if len(episode_numbers) > 1:
+        await add_episode_range(ctx, anime_id, episode_numbers)
+        return
+    
+    episode_number = episode_numbers[0]
     await ctx.send(f"🎬 Bölüm {episode_number} ekleniyor...")
     
-    # AniList'ten anime bilgilerini al
-    anime_data = await get_anilist_anime_info(anime_id=anime_id)
+    # AniList bilgileri ve Movifox erişilebilirliği eşzamanlı alınır
+    anime_data, availability = await asyncio.gather(
+        get_anilist_anime_info(anime_id=anime_id, profile='minimal'),
+        get_movifox_availability([anime_id])
+    )
     
     if not anime_data:
         await ctx.send("❌ Anime bulunamadı.")
@@ -656,25 +1817,13 @@ async def add_episode(ctx, anime_id: int, episode_number: int, *, episode_title=
     
     title = anime_data['title']['romaji'] or anime_data['title']['english']
     episode_title = episode_title or f"Bölüm {episode_number}"
+    movifox_item = availability.get(anime_id)
+    watch_html = f'<p>📺 <a href="{movifox_item["url"]}">Movifox\'ta izle</a></p>' if movifox_item and movifox_item.get('url') else ""
     
     # WordPress'te bölüm postu oluştur
-    post_content = f"""
-    <h2>🎬 {title} - {episode_title}</h2>
-    
-    <h3>📊 Bölüm Bilgileri</h3>
-    <ul>
-        <li><strong>Bölüm:</strong> {episode_number}</li>
-        <li><strong>Başlık:</strong> {episode_title}</li>
-        <li><strong>Eklenme Tarihi:</strong> {datetime.now().strftime('%d.%m.%Y %H:%M')}</li>
-    </ul>
-    
-    <h3>📝 Açıklama</h3>
-    <p>Bu bölüm hakkında detaylı bilgi yakında eklenecek.</p>
-    """
-    
     created_post = await create_wordpress_post(
         title=f"{title} - {episode_title}",
-        content=post_content
+        content=build_episode_post_content(title, episode_number, episode_title, watch_html)
     )
     
     if created_post:
@@ -688,16 +1837,76 @@ async def add_episode(ctx, anime_id: int, episode_number: int, *, episode_title=
             url=created_post['link']
         )
         embed.add_field(name="🔗 Link", value=created_post['link'])
+        watch_text = format_movifox_availability(movifox_item)
+        if watch_text:
+            embed.add_field(name="📺 İzle", value=watch_text, inline=False)
         embed.set_footer(text=f"Ekleyen: {ctx.author.name}")
         await ctx.send(embed=embed)
     else:
         await ctx.send("❌ Bölüm eklenirken hata oluştu.")
 
+async def add_episode_range(ctx, anime_id: int, episode_numbers: List[int]):
+    """Bir bölüm aralığını toplu olarak WordPress'e ve bölüm geçmişine ekle"""
+    first, last = episode_numbers[0], episode_numbers[-1]
+    await ctx.send(f"🎬 Bölüm {first}-{last} ({len(episode_numbers)} bölüm) ekleniyor...")
+    
+    anime_data, availability = await asyncio.gather(
+        get_anilist_anime_info(anime_id=anime_id, profile='minimal'),
+        get_movifox_availability([anime_id])
+    )
+    
+    if not anime_data:
+        await ctx.send("❌ Anime bulunamadı.")
+        return
+    
+    title = anime_data['title']['romaji'] or anime_data['title']['english']
+    movifox_item = availability.get(anime_id)
+    watch_html = f'<p>📺 <a href="{movifox_item["url"]}">Movifox\'ta izle</a></p>' if movifox_item and movifox_item.get('url') else ""
+    
+    posts = [
+        {
+            'title': f"{title} - Bölüm {episode_number}",
+            'content': build_episode_post_content(title, episode_number, f"Bölüm {episode_number}", watch_html)
+        }
+        for episode_number in episode_numbers
+    ]
+    created_posts = await create_wordpress_posts(posts)
+    
+    added = [
+        (episode_number, f"Bölüm {episode_number}", post['id'], ctx.message.id)
+        for episode_number, post in zip(episode_numbers, created_posts) if post
+    ]
+    failed = [episode_number for episode_number, post in zip(episode_numbers, created_posts) if not post]
+    
+    if not added:
+        await ctx.send("❌ Bölümler eklenirken hata oluştu.")
+        return
+    
+    # Bölüm geçmişini tek işlemde güncelle
+    add_episode_history_bulk(anime_id, added)
+    
+    embed = discord.Embed(
+        title="✅ Bölümler Eklendi!" if not failed else "⚠️ Bölümlerin Bir Kısmı Eklendi",
+        description=f"**{title}** - {len(added)}/{len(episode_numbers)} bölüm yayınlandı.",
+        color=discord.Color.green() if not failed else discord.Color.orange()
+    )
+    first_post = next(post for post in created_posts if post)
+    embed.add_field(name="🔗 İlk Bölüm", value=first_post['link'], inline=False)
+    if failed:
+        embed.add_field(name="❌ Eklenemeyen Bölümler", value=", ".join(str(number) for number in failed), inline=False)
+        if wordpress_breaker.state == CircuitBreaker.OPEN:
+            embed.add_field(name="⚠️ WordPress", value="WordPress yanıt vermediği için kalan bölümler gönderilmedi; daha sonra yalnızca bu bölümleri tekrar ekleyin.", inline=False)
+    watch_text = format_movifox_availability(movifox_item)
+    if watch_text:
+        embed.add_field(name="📺 İzle", value=watch_text, inline=False)
+    embed.set_footer(text=f"Ekleyen: {ctx.author.name}")
+    await ctx.send(embed=embed)
+
 @bot.command(name='takip')
 @commands.has_permissions(manage_messages=True)
 async def track_anime(ctx, anime_id: int):
     """Animeyi takip listesine ekle"""
-    anime_data = await get_anilist_anime_info(anime_id=anime_id)
+    anime_data = await get_anilist_anime_info(anime_id=anime_id, profile='minimal')
     
     if not anime_data:
         await ctx.send("❌ Anime bulunamadı.")
@@ -720,26 +1929,123 @@ async def track_anime(ctx, anime_id: int):
 @bot.command(name='takip-listesi')
 async def show_tracked_anime(ctx):
     """Takip edilen anime listesini göster"""
-    tracked_anime = get_tracked_anime()
+    total = count_tracked_anime()
     
-    if not tracked_anime:
+    if not total:
         await ctx.send("📝 Takip edilen anime bulunmuyor.")
         return
     
-    embed = discord.Embed(
-        title="📋 Takip Edilen Anime Listesi",
-        color=discord.Color.blue()
+    def build_embed(rows, page, total_pages):
+        embed = discord.Embed(
+            title="📋 Takip Edilen Anime Listesi",
+            color=discord.Color.blue()
+        )
+        for anime in rows:
+            embed.add_field(
+                name=f"🎬 {anime['title']}",
+                value=f"📊 Son Bölüm: {anime['last_episode']}\n🔄 Durum: {anime['status']}\n📅 Güncelleme: {anime['updated_at']}",
+                inline=False
+            )
+        embed.set_footer(text=f"Toplam {total} anime takip ediliyor | Sayfa {page}/{total_pages}")
+        return embed
+    
+    paginator = KeysetPaginator(
+        author_id=ctx.author.id,
+        fetch_page=lambda cursor: get_tracked_anime_page(cursor, limit=10),
+        cursor_of=lambda row: (row['updated_at'], row['id']),
+        build_embed=build_embed,
+        total=total
     )
+    await paginator.start(ctx)
+
+@bot.command(name='bölüm-geçmişi')
+async def show_episode_history(ctx, anime_id: int, scope: Optional[str] = None):
+    """Bir animenin bölüm geçmişini göster (`arşiv` ile arşivlenmiş kayıtlar dahil)"""
+    include_archive = scope == 'arşiv'
+    # Arşivlenip canlı tablodan silinememiş satırlar iki kez gösterilmez
+    archived = await asyncio.to_thread(load_archived_episode_history, anime_id, get_episode_history_ids(anime_id)) if include_archive else []
+    total = count_episode_history(anime_id) + len(archived)
+    
+    if not total:
+        await ctx.send("📝 Bu anime için bölüm geçmişi bulunmuyor.")
+        return
     
-    for anime in tracked_anime[:10]:  # İlk 10 anime
-        embed.add_field(
-            name=f"🎬 {anime['title']}",
-            value=f"📊 Son Bölüm: {anime['last_episode']}\n🔄 Durum: {anime['status']}\n📅 Güncelleme: {anime['updated_at']}",
-            inline=False
+    def build_embed(rows, page, total_pages):
+        embed = discord.Embed(
+            title=f"📜 Bölüm Geçmişi (AniList ID: {anime_id})",
+            color=discord.Color.blue(),
+            url=f"https://anilist.co/anime/{anime_id}"
         )
+        for episode in rows:
+            embed.add_field(
+                name=f"🎬 Bölüm {episode['episode_number']}: {episode['episode_title']}",
+                value=f"📝 WordPress ID: {episode['wordpress_post_id']}\n📅 Eklenme: {episode['created_at']}",
+                inline=False
+            )
+        embed.set_footer(text=f"Toplam {total} kayıt | Sayfa {page}/{total_pages}")
+        return embed
+    
+    def history_key(row):
+        return (row['episode_number'], row['id'])
+    
+    def fetch_page(cursor):
+        rows = get_episode_history_page(anime_id, cursor, limit=10)
+        if archived:
+            # Arşiv ve canlı tablo aynı keyset sırasıyla birleştirilir
+            rows += [row for row in archived if cursor is None or history_key(row) > tuple(cursor)][:10]
+            rows = sorted(rows, key=history_key)[:10]
+        return rows
+    
+    paginator = KeysetPaginator(
+        author_id=ctx.author.id,
+        fetch_page=fetch_page,
+        cursor_of=history_key,
+        build_embed=build_embed,
+        total=total
+    )
+    await paginator.start(ctx)
+
+@bot.command(name='kanal-temizle', usage='!kanal-temizle [miktar] [--yazar @kullanıcı] [--gün N] [--bot true]')
+@commands.has_permissions(manage_messages=True)
+async def purge_channel(ctx, amount: Optional[int] = 100, *, flags: PurgeFlags):
+    """Temizlik kanalındaki mesajları filtrelere göre sil"""
+    channel = bot.get_channel(PURGE_CHANNEL_ID) if PURGE_CHANNEL_ID else None
+    if not channel:
+        await ctx.send("❌ Temizlik kanalı (PURGE_CHANNEL_ID) ayarlanmamış veya bulunamadı.")
+        return
     
-    embed.set_footer(text=f"Toplam {len(tracked_anime)} anime takip ediliyor")
-    await ctx.send(embed=embed)
+    amount = min(amount or 100, PURGE_MAX_MESSAGES)
+    older_than = discord.utils.utcnow() - timedelta(days=flags.older_than_days) if flags.older_than_days else None
+    status_message = await ctx.send(f"🧹 {channel.mention} temizleniyor... (en fazla {amount} mesaj taranacak)")
+    protected_ids = {ctx.message.id, status_message.id}
+    
+    def check(message):
+        if message.id in protected_ids or message.pinned:
+            return False
+        if flags.author and message.author.id != flags.author.id:
+            return False
+        if flags.bot_only and not message.author.bot:
+            return False
+        return True
+    
+    async def progress(stats):
+        await status_message.edit(content=f"🧹 Temizleniyor... {stats['bulk'] + stats['single']} mesaj silindi, {stats['scanned']} mesaj tarandı")
+    
+    stats = await purge_channel_messages(channel, check=check, limit=amount, before=older_than, progress=progress)
+    
+    embed = discord.Embed(
+        title="🧹 Kanal Temizlendi",
+        description=f"{channel.mention} kanalında **{stats['bulk'] + stats['single']}** mesaj silindi.",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="🔍 Taranan", value=stats['scanned'], inline=True)
+    embed.add_field(name="📦 Toplu Silinen", value=stats['bulk'], inline=True)
+    embed.add_field(name="🗑️ Tekil Silinen", value=stats['single'], inline=True)
+    if stats['failed']:
+        embed.add_field(name="⚠️ Silinemeyen", value=stats['failed'], inline=True)
+    embed.set_footer(text=f"Temizleyen: {ctx.author.name}")
+    await status_message.edit(content=None, embed=embed)
+    logger.info("Kanal temizlendi (%s): %s", channel.id, stats)
 
 @bot.command(name='durum')
 async def bot_status(ctx):
@@ -753,9 +2059,22 @@ async def bot_status(ctx):
     embed.add_field(name="📊 Gecikme", value=f"{round(bot.latency * 1000)}ms", inline=True)
     embed.add_field(name="🌐 Sunucu Sayısı", value=len(bot.guilds), inline=True)
     embed.add_field(name="👥 Kullanıcı Sayısı", value=len(bot.users), inline=True)
-    embed.add_field(name="📝 Takip Edilen Anime", value=len(get_tracked_anime()), inline=True)
+    embed.add_field(name="📝 Takip Edilen Anime", value=count_tracked_anime(), inline=True)
     embed.add_field(name="🔗 WordPress", value="Bağlı" if WORDPRESS_API_URL else "Bağlantı Yok", inline=True)
     
+    breaker_labels = {
+        CircuitBreaker.CLOSED: "🟢 Kapalı",
+        CircuitBreaker.HALF_OPEN: "🟡 Yarı Açık",
+        CircuitBreaker.OPEN: "🔴 Açık",
+    }
+    breaker_lines = []
+    for breaker in CIRCUIT_BREAKERS:
+        line = f"{breaker.name}: {breaker_labels[breaker.state]}"
+        if breaker.state == CircuitBreaker.OPEN:
+            line += f" ({round(breaker.retry_after())}sn)"
+        breaker_lines.append(line)
+    embed.add_field(name="🔌 Devre Kesiciler", value="\n".join(breaker_lines), inline=False)
+    
     embed.set_footer(text=f"Bot ID: {bot.user.id}")
     embed.timestamp = datetime.utcnow()
     
@@ -775,9 +2094,11 @@ async def help_command(ctx):
         ("!ara <anime adı>", "AniList'te anime arar"),
         ("!anime <AniList ID>", "Anime detaylarını gösterir"),
         ("!post-oluştur <anime adı>", "WordPress'te anime postu oluşturur"),
-        ("!bölüm-ekle <ID> <bölüm> [başlık]", "Animeye yeni bölüm ekler"),
+        ("!bölüm-ekle <ID> <bölüm|başlangıç-bitiş> [başlık]", "Animeye yeni bölüm veya bölüm aralığı ekler"),
         ("!takip <AniList ID>", "Animeyi takip listesine ekler"),
         ("!takip-listesi", "Takip edilen anime listesini gösterir"),
+        ("!bölüm-geçmişi <AniList ID> [arşiv]", "Animenin bölüm geçmişini gösterir"),
+        ("!kanal-temizle [miktar] [--yazar @kullanıcı] [--gün N] [--bot true]", "Temizlik kanalındaki mesajları siler"),
         ("!durum", "Bot durumunu gösterir"),
         ("!yardım", "Bu yardım menüsünü gösterir")
     ]
@@ -788,50 +2109,221 @@ async def help_command(ctx):
     embed.set_footer(text="Melianime Bot v2.0 | Gelişmiş Anime Takip Sistemi")
     await ctx.send(embed=embed)
 
-# --- 9. Periyodik Görevler ---
+# --- 11. Periyodik Görevler ---
+# AniList ID -> duyurulan son bölüm; yeniden başlatmada anlık görüntüden yüklenir
+checker_watermarks: Dict[int, int] = {}
+checker_last_run: Optional[float] = None
+# Görev adı -> anlık görüntüden gelen bir sonraki çalışma zamanı (epoch)
+scheduled_resume: Dict[str, float] = {}
+
+async def wait_for_scheduled_resume(name: str):
+    """Görevin ilk çalışmasını, kapanıştan önce planlanan zamana kadar ertele"""
+    await bot.wait_until_ready()
+    resume_at = scheduled_resume.get(name)
+    if resume_at:
+        delay = resume_at - time.time()
+        if delay > 0:
+            logger.info("%s görevi %.0f saniye sonra devam edecek", name, delay)
+            await asyncio.sleep(delay)
+        scheduled_resume.pop(name, None)
+
 @tasks.loop(hours=6)
 async def anime_checker():
     """Takip edilen anime'leri kontrol et"""
+    global checker_last_run
     logger.info("Anime kontrol görevi başlatıldı")
+    checker_last_run = time.time()
     
     tracked_anime = get_tracked_anime()
     if not tracked_anime:
         return
     
-    for anime in tracked_anime:
-        try:
-            # AniList'ten güncel bilgileri al
-            anime_data = await get_anilist_anime_info(anime_id=anime['anilist_id'])
-            
-            if anime_data and anime_data.get('episodes'):
-                current_episodes = anime_data['episodes']
-                last_episode = anime['last_episode']
+    # Movifox erişilebilirliği AniList kontrolleriyle eşzamanlı önceden alınır
+    availability_task = asyncio.create_task(
+        get_movifox_availability([anime['anilist_id'] for anime in tracked_anime])
+    )
+    
+    try:
+        for anime in tracked_anime:
+            try:
+                # AniList'ten güncel bilgileri al
+                anime_data = await get_anilist_anime_info(anime_id=anime['anilist_id'], profile='notify')
                 
-                # Yeni bölüm varsa bildir
-                if current_episodes and current_episodes > last_episode:
-                    embed = discord.Embed(
-                        title="🎬 Yeni Bölüm Yayınlandı!",
-                        description=f"**{anime['title']}** için yeni bölüm bulundu!",
-                        color=discord.Color.green()
-                    )
-                    embed.add_field(name="📊 Yeni Bölüm", value=f"Bölüm {current_episodes}")
-                    embed.add_field(name="📅 Önceki Bölüm", value=f"Bölüm {last_episode}")
-                    
-                    if TARGET_CHANNEL_ID:
-                        channel = bot.get_channel(TARGET_CHANNEL_ID)
-                        if channel:
-                            await channel.send(embed=embed)
+                if anime_data and anime_data.get('episodes'):
+                    current_episodes = anime_data['episodes']
+                    last_episode = anime['last_episode']
+                    announced_episode = checker_watermarks.get(anime['anilist_id'], 0)
                     
-                    logger.info(f"Yeni bölüm bildirimi: {anime['title']} Bölüm {current_episodes}")
-                    
-        except Exception as e:
-            logger.error(f"Anime kontrol hatası ({anime['title']}): {e}")
+                    # Yeni bölüm varsa ve daha önce duyurulmadıysa bildir
+                    if current_episodes and current_episodes > max(last_episode, announced_episode):
+                        embed = discord.Embed(
+                            title="🎬 Yeni Bölüm Yayınlandı!",
+                            description=f"**{anime['title']}** için yeni bölüm bulundu!",
+                            color=discord.Color.green()
+                        )
+                        embed.add_field(name="📊 Yeni Bölüm", value=f"Bölüm {current_episodes}")
+                        embed.add_field(name="📅 Önceki Bölüm", value=f"Bölüm {last_episode}")
+                        
+                        availability = await await_movifox_availability(availability_task)
+                        watch_text = format_movifox_availability(availability.get(anime['anilist_id']))
+                        if watch_text:
+                            embed.add_field(name="📺 İzle", value=watch_text, inline=False)
+                        
+                        if TARGET_CHANNEL_ID:
+                            channel = bot.get_channel(TARGET_CHANNEL_ID)
+                            if channel:
+                                await channel.send(embed=embed)
+                        
+                        checker_watermarks[anime['anilist_id']] = current_episodes
+                        logger.info("Yeni bölüm bildirimi: %s Bölüm %s", anime['title'], current_episodes, extra={'sample': False})
+                        
+            except CircuitOpenError as e:
+                logger.warning("Anime kontrolü durduruldu: %s", e)
+                break
+            except Exception as e:
+                logger.error("Anime kontrol hatası (%s): %s", anime['title'], e)
+    finally:
+        # Kesilen veya hatalı bir turda arka plan sorgusu sızdırılmaz
+        if not availability_task.done():
+            availability_task.cancel()
+
+@tasks.loop(hours=24)
+async def purge_retention():
+    """Temizlik kanalında saklama süresini aşan mesajları sil"""
+    channel = bot.get_channel(PURGE_CHANNEL_ID) if PURGE_CHANNEL_ID else None
+    if not channel or not PURGE_RETENTION_DAYS:
+        return
+    
+    cutoff = discord.utils.utcnow() - timedelta(days=PURGE_RETENTION_DAYS)
+    stats = await purge_channel_messages(channel, check=lambda message: not message.pinned, before=cutoff)
+    logger.info("Saklama süresi temizliği tamamlandı (%s): %s", channel.id, stats)
+
+@tasks.loop(hours=24)
+async def history_maintenance():
+    """Eski bölüm geçmişini arşivle ve boşalan veritabanı sayfalarını geri ver"""
+    if HISTORY_RETENTION_DAYS:
+        await asyncio.to_thread(archive_episode_history, HISTORY_RETENTION_DAYS)
+    await asyncio.to_thread(incremental_vacuum)
+
+@anime_checker.before_loop
+async def before_anime_checker():
+    await wait_for_scheduled_resume('anime_checker')
+
+@purge_retention.before_loop
+async def before_purge_retention():
+    await wait_for_scheduled_resume('purge_retention')
 
-# --- 10. Bot Başlatma ---
+@history_maintenance.before_loop
+async def before_history_maintenance():
+    await wait_for_scheduled_resume('history_maintenance')
+
+# --- 12. Anlık Görüntü (Hızlı Yeniden Başlatma) ---
+SNAPSHOT_FILE = os.getenv("SNAPSHOT_FILE", "bot_snapshot.json")
+SNAPSHOT_VERSION = 1
+SCHEDULED_LOOPS = {
+    'anime_checker': anime_checker,
+    'purge_retention': purge_retention,
+    'history_maintenance': history_maintenance,
+}
+
+def _database_signature() -> Optional[List[float]]:
+    """Veritabanı dosyasının değişip değişmediğini anlamak için (mtime, boyut)"""
+    try:
+        stat = os.stat(DATABASE_NAME)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+def write_snapshot():
+    """Temiz kapanışta sıcak durumu (konfigürasyon, takip listesi, görev zamanları) diske yaz"""
+    now_wall, now_mono = time.time(), time.monotonic()
+    schedule = {}
+    for name, loop in SCHEDULED_LOOPS.items():
+        if loop.is_running() and loop.next_iteration:
+            schedule[name] = loop.next_iteration.timestamp()
+        elif name in scheduled_resume:
+            # Görev henüz ertelenmiş ilk çalışmasını bekliyor
+            schedule[name] = scheduled_resume[name]
+    
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'written_at': now_wall,
+        'database': _database_signature(),
+        'config': config_cache if config_cache is not None else load_config_cache(),
+        'tracked': get_tracked_anime(),
+        'watermarks': {
+            'last_run': checker_last_run,
+            'episodes': {str(anilist_id): episode for anilist_id, episode in checker_watermarks.items()},
+        },
+        'schedule': schedule,
+        # Monotonik son geçerlilik zamanları duvar saatine çevrilerek saklanır
+        'anilist_cache': [
+            [anilist_id, sorted(fields), data, now_wall + (expires_at - now_mono)]
+            for anilist_id, (fields, data, expires_at) in anilist_media_cache.items()
+            if expires_at > now_mono
+        ],
+    }
+    
+    temp_path = f"{SNAPSHOT_FILE}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(temp_path, SNAPSHOT_FILE)
+        logger.info("Anlık görüntü kaydedildi: %s", SNAPSHOT_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        logger.error("Anlık görüntü kaydedilirken hata: %s", e)
+
+def load_snapshot() -> bool:
+    """Önceki temiz kapanıştan kalan anlık görüntüyü yükle
+    
+    Dosya yüklendikten sonra silinir; böylece ardından gelen bir çökme
+    sonrasında eski durum tekrar kullanılmaz. Veritabanı kapanıştan sonra
+    değiştiyse yalnızca görev zamanları ve önbellekler alınır.
+    """
+    global config_cache, tracked_anime_cache, checker_last_run
+    try:
+        with open(SNAPSHOT_FILE, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError) as e:
+        logger.error("Anlık görüntü okunurken hata: %s", e)
+        return False
+    finally:
+        try:
+            os.remove(SNAPSHOT_FILE)
+        except OSError:
+            pass
+    
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        return False
+    
+    if snapshot.get('database') == _database_signature():
+        config_cache = snapshot.get('config')
+        tracked_anime_cache = snapshot.get('tracked')
+    
+    watermarks = snapshot.get('watermarks') or {}
+    checker_last_run = watermarks.get('last_run')
+    checker_watermarks.update({int(anilist_id): episode for anilist_id, episode in (watermarks.get('episodes') or {}).items()})
+    scheduled_resume.update(snapshot.get('schedule') or {})
+    
+    now_wall, now_mono = time.time(), time.monotonic()
+    for anilist_id, fields, data, expires_wall in snapshot.get('anilist_cache') or []:
+        if expires_wall > now_wall:
+            anilist_media_cache[anilist_id] = (frozenset(fields), data, now_mono + (expires_wall - now_wall))
+    
+    logger.info("Anlık görüntü yüklendi (%.0f saniye önce kaydedilmiş)", time.time() - snapshot.get('written_at', 0))
+    return True
+
+# --- 13. Bot Başlatma ---
 if __name__ == "__main__":
     print("🎭 Melianime Bot v2.0 Başlatılıyor...")
     print("=" * 50)
     
+    # Önceki temiz kapanıştan kalan durumu yükle (konfigürasyon okumalarından önce)
+    if load_snapshot():
+        print("⚡ Anlık görüntüden hızlı başlatılıyor...")
+    
     # Çevre değişkenlerini kontrol et
     if not check_and_load_environment_variables():
         print("❌ Çevre değişkenleri yüklenemedi!")
@@ -841,12 +2333,12 @@ if __name__ == "__main__":
     print("🔗 Discord'a bağlanılıyor...")
     
     try:
-        bot.run(DISCORD_BOT_TOKEN)
+        bot.run(DISCORD_BOT_TOKEN, log_handler=None)
     except discord.errors.LoginFailure:
         logger.critical("Discord bot token'ı geçersiz!")
         print("❌ Discord token'ı geçersiz!")
         exit(1)
     except Exception as e:
-        logger.critical(f"Bot başlatılırken hata: {e}")
+        logger.critical("Bot başlatılırken hata: %s", e)
         print(f"❌ Bot başlatılırken hata: {e}")
         exit(1)